@@ -1,6 +1,11 @@
 """MCP Tools - Generate MCP tools from markdown templates."""
 
-from .models import Template, TemplateVariable
+from .models import (
+    Template,
+    TemplateVariable,
+    TemplateSearchHit,
+    TemplateSearchResults,
+)
 from .loader import (
     load,
     load_from_url,
@@ -9,13 +14,32 @@ from .loader import (
     is_url,
 )
 from .parser import parse, render
-from .generator import register_template
-from .server import app, mcp, starlette_app
+from .search import TemplateIndex
+from .manifest import ManifestSnapshot, ToolManifest, etag_matches
+from .generator import (
+    register_template,
+    unregister_template,
+    register_search,
+    register_manifest,
+)
+
+
+def __getattr__(name: str):
+    # Import the server lazily: it loads templates and builds the MCP app on
+    # import, which library users and the bulk CLI do not need.
+    if name in ("app", "index", "tool_manifest", "mcp", "starlette_app"):
+        from . import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Models
     "Template",
     "TemplateVariable",
+    "TemplateSearchHit",
+    "TemplateSearchResults",
     # Loader
     "load",
     "load_from_url",
@@ -25,10 +49,21 @@ __all__ = [
     # Parser
     "parse",
     "render",
+    # Search
+    "TemplateIndex",
+    # Manifest
+    "ToolManifest",
+    "ManifestSnapshot",
+    "etag_matches",
     # Generator
     "register_template",
+    "unregister_template",
+    "register_search",
+    "register_manifest",
     # Server
     "app",
+    "index",
+    "tool_manifest",
     "mcp",
     "starlette_app",
 ]
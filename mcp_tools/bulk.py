@@ -0,0 +1,367 @@
+"""
+Offline bulk rendering of templates from JSONL records.
+
+Each input line is a JSON object naming a template and its values:
+
+    {"template": "create_this_is_an_demo", "values": {"title": "..."}, "id": "1"}
+
+Records are validated against the template variables and rendered across a
+process pool. Results are written in input order, either as JSONL or as one
+file per record.
+
+Usage:
+    python -m mcp_tools.bulk .github/ISSUE_TEMPLATE -i records.jsonl -o out.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+from .generator import _slugify
+from .loader import is_url, load
+from .models import Template
+from .parser import parse, render
+
+# Templates available to the current worker process, set by `_init_worker`
+_templates: dict[str, Template] = {}
+_remove_comments = True
+
+
+def load_templates(sources: str) -> dict[str, Template]:
+    """
+    Load and parse templates from comma-separated sources.
+
+    Each template can be referenced by its name, its tool name
+    (`create_<slug>`) or its file stem. Unlike the server, which skips
+    sources it cannot load, any missing source or failing template raises,
+    so a batch never runs against a partial registry.
+    """
+    templates: dict[str, Template] = {}
+
+    for source in (s.strip() for s in sources.split(",") if s.strip()):
+        if not is_url(source) and not Path(source).exists():
+            raise ValueError(f"Source not found: {source}")
+
+        try:
+            loaded = list(load(source))
+        except Exception as e:
+            raise ValueError(f"Error loading {source}: {e}") from e
+
+        for template in loaded:
+            try:
+                parsed = parse(template)
+            except Exception as e:
+                raise ValueError(f"Failed: {template.source} - {e}") from e
+            for key in (
+                parsed.name,
+                f"create_{_slugify(parsed.name)}",
+                Path(template.source).stem,
+            ):
+                templates.setdefault(key, parsed)
+
+    return templates
+
+
+def render_record(line: str) -> dict:
+    """
+    Validate and render a single JSONL record.
+
+    Returns a result with `output` on success or `error` on failure.
+    """
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        return {"error": f"Invalid JSON: {e}"}
+
+    if not isinstance(record, dict):
+        return {"error": "Record must be a JSON object"}
+
+    result = {key: record[key] for key in ("id", "template") if key in record}
+
+    name = record.get("template")
+    if name is None:
+        result["error"] = "Missing template"
+        return result
+    if not isinstance(name, str):
+        result["error"] = "Template must be a string"
+        return result
+
+    template = _templates.get(name)
+    if template is None:
+        result["error"] = f"Unknown template: {name!r}"
+        return result
+
+    values = record.get("values", {})
+    if not isinstance(values, dict):
+        result["error"] = "Values must be a JSON object"
+        return result
+
+    missing = [name for name in template.variable_names if name not in values]
+    invalid = [
+        name
+        for name in template.variable_names
+        if not isinstance(values.get(name), str)
+    ]
+    if missing:
+        result["error"] = f"Missing variables: {', '.join(missing)}"
+    elif invalid:
+        result["error"] = f"Variables must be strings: {', '.join(invalid)}"
+    else:
+        try:
+            result["output"] = render(
+                template, values, remove_comments=_remove_comments
+            )
+        except Exception as e:
+            result["error"] = f"Render failed: {e}"
+
+    return result
+
+
+def _init_worker(templates: dict[str, Template], remove_comments: bool) -> None:
+    """Install the template registry in a worker process."""
+    global _templates, _remove_comments
+    _templates = templates
+    _remove_comments = remove_comments
+
+
+def _render_chunk(lines: list[str]) -> list[dict]:
+    return [render_record(line) for line in lines]
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def render_stream(
+    lines: Iterable[str],
+    templates: dict[str, Template],
+    *,
+    workers: int = 1,
+    chunk_size: int = 256,
+    remove_comments: bool = True,
+) -> Iterator[dict]:
+    """
+    Render JSONL records, yielding results in input order.
+
+    Input is read lazily and at most two chunks per worker are in flight,
+    so memory stays bounded for arbitrarily large inputs.
+
+    Args:
+        lines: JSONL records (blank lines are skipped)
+        templates: Templates by name, as returned by `load_templates`
+        workers: Number of worker processes (1 renders in-process)
+        chunk_size: Number of records dispatched to a worker at once
+        remove_comments: Whether to remove HTML comments in output
+
+    Yields:
+        One result per record with its 1-based input `line` number
+    """
+    numbered = (
+        (number, line) for number, line in enumerate(lines, start=1) if line.strip()
+    )
+
+    def with_numbers(chunk: list[tuple[int, str]], results: list[dict]):
+        for (number, _), result in zip(chunk, results):
+            yield {"line": number, **result}
+
+    if workers <= 1:
+        _init_worker(templates, remove_comments)
+        for chunk in _chunks(numbered, chunk_size):
+            yield from with_numbers(chunk, _render_chunk([line for _, line in chunk]))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(templates, remove_comments),
+    ) as pool:
+        pending: deque[tuple[list[tuple[int, str]], Future]] = deque()
+
+        for chunk in _chunks(numbered, chunk_size):
+            future = pool.submit(_render_chunk, [line for _, line in chunk])
+            pending.append((chunk, future))
+
+            if len(pending) >= workers * 2:
+                done, future = pending.popleft()
+                yield from with_numbers(done, future.result())
+
+        while pending:
+            done, future = pending.popleft()
+            yield from with_numbers(done, future.result())
+
+
+def _id_name(result: dict) -> str:
+    """File name stem for a result's id, or an empty string if it has none."""
+    return Path(str(result["id"])).name if "id" in result else ""
+
+
+def _output_path(
+    directory: Path, result: dict, extension: str, taken: set[Path]
+) -> Path | None:
+    """
+    Choose the output file for a result, named by its id or line number.
+
+    Falls back to the line number when the id was already written in this
+    run. Returns None if that name is taken as well.
+    """
+    for name in (_id_name(result), format(result["line"], "08d")):
+        path = directory / f"{name}{extension}"
+        if name and path not in taken:
+            taken.add(path)
+            return path
+    return None
+
+
+def _write_file(
+    directory: Path, result: dict, extension: str, written: set[Path]
+) -> None:
+    """
+    Write a rendered result to its own file.
+
+    Failures are recorded as the result's `error` instead of its `output`.
+    """
+    path = _output_path(directory, result, extension, written)
+    if path is None:
+        del result["output"]
+        result["error"] = "Output file already written in this run"
+        return
+
+    try:
+        path.write_text(result["output"], encoding="utf-8")
+    except OSError as e:
+        del result["output"]
+        result["error"] = f"Cannot write output: {e}"
+        return
+
+    if _id_name(result) and path.name != f"{_id_name(result)}{extension}":
+        print(
+            f"  ! Line {result['line']}: Duplicate id {result['id']!r},"
+            f" written to {path.name}",
+            file=sys.stderr,
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        prog="mcp-markdown-render",
+        description="Render markdown templates in bulk from JSONL records.",
+    )
+    parser.add_argument(
+        "sources",
+        nargs="?",
+        default=os.getenv("MCP_TEMPLATES_SOURCE", ".github/ISSUE_TEMPLATE"),
+        help="Template sources, comma-separated (default: $MCP_TEMPLATES_SOURCE)",
+    )
+    parser.add_argument(
+        "-i", "--input", default="-", help="JSONL input file (default: stdin)"
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "-o", "--output", default="-", help="JSONL output file (default: stdout)"
+    )
+    output.add_argument(
+        "-d", "--output-dir", type=Path, help="Write one file per record instead"
+    )
+    parser.add_argument(
+        "-e", "--extension", default=".md", help="File extension for --output-dir"
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=256, help="Records per dispatched chunk"
+    )
+    parser.add_argument(
+        "--keep-comments", action="store_true", help="Keep HTML comments in output"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        templates = load_templates(args.sources)
+    except Exception as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 2
+    if not templates:
+        print(f"✗ No templates found in: {args.sources}", file=sys.stderr)
+        return 2
+
+    try:
+        source: TextIO = (
+            sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+        )
+    except OSError as e:
+        print(f"✗ Cannot read input: {e}", file=sys.stderr)
+        return 2
+
+    sink: TextIO | None = None
+    try:
+        if args.output_dir is not None:
+            args.output_dir.mkdir(parents=True, exist_ok=True)
+        elif args.output == "-":
+            sink = sys.stdout
+        else:
+            sink = open(args.output, "w", encoding="utf-8")
+    except OSError as e:
+        print(f"✗ Cannot write output: {e}", file=sys.stderr)
+        if source is not sys.stdin:
+            source.close()
+        return 2
+
+    rendered = failed = 0
+    written: set[Path] = set()
+    start = time.perf_counter()
+
+    try:
+        for result in render_stream(
+            source,
+            templates,
+            workers=args.workers,
+            chunk_size=max(1, args.chunk_size),
+            remove_comments=not args.keep_comments,
+        ):
+            if sink is None and "output" in result:
+                _write_file(args.output_dir, result, args.extension, written)
+
+            if "error" in result:
+                failed += 1
+                print(
+                    f"  ✗ Line {result['line']}: {result['error']}", file=sys.stderr
+                )
+            else:
+                rendered += 1
+
+            if sink is not None:
+                sink.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not None and sink is not sys.stdout:
+            sink.close()
+
+    elapsed = time.perf_counter() - start
+    total = rendered + failed
+    print(
+        f"Rendered {rendered}/{total} records ({failed} failed) in {elapsed:.2f}s"
+        f" - {total / elapsed if elapsed else 0:.0f} records/s",
+        file=sys.stderr,
+    )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
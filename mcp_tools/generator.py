@@ -1,11 +1,14 @@
 """Generate FastAPI endpoints from templates."""
 
 import re
-from fastapi import FastAPI
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.routing import APIRoute
 from pydantic import Field, create_model
 
-from .models import Template
+from .models import Template, TemplateSearchResults
+from .manifest import ToolManifest, etag_matches
 from .parser import parse, render
+from .search import TemplateIndex
 
 
 def _slugify(text: str) -> str:
@@ -34,15 +37,25 @@ def register_template(
     *,
     tool_name: str | None = None,
     remove_comments: bool = True,
-) -> None:
+    index: TemplateIndex | None = None,
+    manifest: ToolManifest | None = None,
+) -> str:
     """
     Register a template as a FastAPI endpoint.
 
+    The tool name is also used as the endpoint's operation ID, so it is the
+    name of the MCP tool generated from it.
+
     Args:
         app: FastAPI application
         template: Parsed template
         tool_name: Custom endpoint name (default: derived from template name)
         remove_comments: Whether to remove HTML comments in output
+        index: Search index to add the template to
+        manifest: Tool manifest to invalidate
+
+    Returns:
+        The registered tool name
     """
     # Parse template if not already parsed
     if not template.variables:
@@ -72,7 +85,111 @@ def register_template(
     app.post(
         f"/{name}",
         name=name,
+        operation_id=name,
         description=description,
         summary=template.name or name,
         tags=["Template Tools"],
     )(endpoint)
+
+    if index is not None:
+        index.add(name, template)
+    if manifest is not None:
+        manifest.invalidate()
+
+    return name
+
+
+def unregister_template(
+    app: FastAPI,
+    tool_name: str,
+    *,
+    index: TemplateIndex | None = None,
+    manifest: ToolManifest | None = None,
+) -> None:
+    """
+    Remove a template endpoint previously added by `register_template`.
+
+    Args:
+        app: FastAPI application
+        tool_name: Name returned by `register_template`
+        index: Search index to remove the template from
+        manifest: Tool manifest to invalidate
+    """
+    app.router.routes = [
+        route
+        for route in app.router.routes
+        if not (isinstance(route, APIRoute) and route.name == tool_name)
+    ]
+    app.openapi_schema = None
+
+    if index is not None:
+        index.remove(tool_name)
+    if manifest is not None:
+        manifest.invalidate()
+
+
+def register_search(app: FastAPI, index: TemplateIndex) -> None:
+    """
+    Register the `search_templates` endpoint backed by a search index.
+
+    Args:
+        app: FastAPI application
+        index: Search index of registered templates
+    """
+
+    async def search_templates(
+        q: str = Query(description="Words or word prefixes to search for"),
+        limit: int = Query(10, ge=1, le=100, description="Maximum results"),
+        offset: int = Query(0, ge=0, description="Number of results to skip"),
+    ) -> TemplateSearchResults:
+        return index.search(q, limit=limit, offset=offset)
+
+    app.get(
+        "/search_templates",
+        name="search_templates",
+        operation_id="search_templates",
+        description=(
+            "Search the registered templates by name, description, section "
+            "headers and variable descriptions. Returns the ranked tool names."
+        ),
+        summary="Search templates",
+        tags=["Search"],
+    )(search_templates)
+
+
+def register_manifest(app: FastAPI, manifest: ToolManifest) -> None:
+    """
+    Register the `/tools` endpoint serving the cached tool manifest.
+
+    Responses carry an `ETag` and `X-Manifest-Version` header; requests with
+    a matching `If-None-Match` header get an empty `304 Not Modified`.
+
+    Args:
+        app: FastAPI application
+        manifest: Tool manifest built from the application's routes
+    """
+
+    async def list_tools(
+        request: Request,
+        tag: str | None = Query(None, description="Only tools with this tag"),
+        offset: int = Query(0, ge=0, description="Number of tools to skip"),
+        limit: int | None = Query(None, ge=1, description="Maximum tools"),
+    ) -> Response:
+        snapshot = manifest.snapshot()
+        headers = {
+            "ETag": snapshot.etag,
+            "X-Manifest-Version": str(snapshot.version),
+            "Cache-Control": "no-cache",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, snapshot.etag):
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            snapshot.page(tag=tag, offset=offset, limit=limit),
+            media_type="application/json",
+            headers=headers,
+        )
+
+    app.get("/tools", name="list_tools", include_in_schema=False)(list_tools)
@@ -0,0 +1,151 @@
+"""Precomputed, cacheable manifest of the tools exposed by the server."""
+
+import hashlib
+import json
+import time
+
+from fastapi import FastAPI
+from pydantic import BaseModel, Field
+
+HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+
+
+def _input_schema(operation: dict, schemas: dict) -> dict:
+    """Build a tool input schema from an OpenAPI operation."""
+    body = operation.get("requestBody", {}).get("content", {})
+    schema = body.get("application/json", {}).get("schema")
+    if schema is not None:
+        ref = schema.get("$ref", "")
+        return schemas.get(ref.split("/")[-1], schema) if ref else schema
+
+    properties = {}
+    required = []
+    for param in operation.get("parameters", []):
+        properties[param["name"]] = param.get("schema", {})
+        if param.get("required"):
+            required.append(param["name"])
+
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    The header may list several ETags or be `*`. Comparison is weak, so
+    `W/"x"` matches `"x"`.
+    """
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _dumps(data: object) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class ManifestSnapshot(BaseModel):
+    """
+    Serialized tool manifest for a single registry generation.
+
+    The ETag depends only on the manifest content, so identical manifests
+    share it across generations and restarts. The generation is reported
+    separately as `version`.
+    """
+
+    version: int
+    etag: str
+    tools: list[str] = Field(default_factory=list)  # One JSON object per tool
+    tags: dict[str, list[int]] = Field(default_factory=dict)
+    build_seconds: float = 0.0
+    size_bytes: int = 0
+
+    def page(
+        self, *, tag: str | None = None, offset: int = 0, limit: int | None = None
+    ) -> str:
+        """Serialize a page of the manifest, optionally filtered by tag."""
+        positions = self.tags.get(tag, []) if tag else range(len(self.tools))
+        stop = None if limit is None else offset + limit
+        selected = positions[offset:stop]
+
+        header = _dumps(
+            {
+                "etag": self.etag,
+                "total": len(positions),
+                "offset": offset,
+                "limit": limit,
+            }
+        )
+        tools = ",".join(self.tools[i] for i in selected)
+        return f'{header[:-1]},"tools":[{tools}]}}'
+
+
+class ToolManifest:
+    """
+    Tool manifest derived from the FastAPI routes of an application.
+
+    The manifest is built at most once per registry generation. Call
+    `invalidate` whenever routes are added or removed.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self.app = app
+        self.generation = 0
+        self._snapshot: ManifestSnapshot | None = None
+
+    def invalidate(self) -> None:
+        """Start a new registry generation and drop the cached manifest."""
+        self.generation += 1
+        self._snapshot = None
+        self.app.openapi_schema = None
+
+    def snapshot(self) -> ManifestSnapshot:
+        """Return the manifest for the current generation, building it if needed."""
+        if self._snapshot is None:
+            self._snapshot = self.build()
+        return self._snapshot
+
+    def build(self) -> ManifestSnapshot:
+        """Build and serialize the manifest from the current OpenAPI schema."""
+        start = time.perf_counter()
+
+        openapi = self.app.openapi()
+        schemas = openapi.get("components", {}).get("schemas", {})
+
+        tools: list[str] = []
+        tags: dict[str, list[int]] = {}
+        digest = hashlib.sha256()
+
+        for path, methods in openapi.get("paths", {}).items():
+            for method in HTTP_METHODS:
+                operation = methods.get(method)
+                if operation is None:
+                    continue
+
+                tool = _dumps(
+                    {
+                        "name": operation.get("operationId", path.strip("/")),
+                        "title": operation.get("summary", ""),
+                        "description": operation.get("description", ""),
+                        "tags": operation.get("tags", []),
+                        "method": method.upper(),
+                        "path": path,
+                        "inputSchema": _input_schema(operation, schemas),
+                    }
+                )
+                for tag in operation.get("tags", []):
+                    tags.setdefault(tag, []).append(len(tools))
+                tools.append(tool)
+                digest.update(tool.encode())
+
+        return ManifestSnapshot(
+            version=self.generation,
+            etag=f'"{digest.hexdigest()[:16]}"',
+            tools=tools,
+            tags=tags,
+            build_seconds=time.perf_counter() - start,
+            size_bytes=sum(len(tool.encode()) for tool in tools),
+        )
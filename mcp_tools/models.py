@@ -23,3 +23,23 @@ class Template(BaseModel):
     @property
     def variable_names(self) -> list[str]:
         return [v.name for v in self.variables]
+
+
+class TemplateSearchHit(BaseModel):
+    """A single ranked result from a template search."""
+
+    tool_name: str
+    name: str = ""
+    about: str = ""
+    score: float = 0.0
+
+
+class TemplateSearchResults(BaseModel):
+    """A page of ranked template search results."""
+
+    query: str
+    total: int = 0
+    offset: int = 0
+    limit: int = 10
+    truncated: bool = False  # Some prefix expansions were skipped
+    items: list[TemplateSearchHit] = Field(default_factory=list)
@@ -1,7 +1,9 @@
 """Parse markdown templates and extract variables."""
 
 import re
+from functools import lru_cache
 from jinja2 import Environment, StrictUndefined
+from jinja2 import Template as JinjaTemplate
 
 from .models import Template, TemplateVariable
 
@@ -11,6 +13,15 @@ VARIABLE_PATTERN = re.compile(r"<([a-z][a-z0-9_]*)>")
 SECTION_PATTERN = re.compile(r"(###\s*[^:\n]+:)")
 COMMENT_PATTERN = re.compile(r"<!--[\s\S]*?-->")
 
+# Render with custom delimiters for <variable> syntax
+_ENV = Environment(
+    undefined=StrictUndefined,
+    autoescape=False,
+    keep_trailing_newline=True,
+    variable_start_string="<",
+    variable_end_string=">",
+)
+
 
 def _extract_frontmatter(content: str) -> dict[str, str]:
     """Extract YAML frontmatter fields."""
@@ -105,6 +116,20 @@ def parse(template: Template) -> Template:
     )
 
 
+@lru_cache(maxsize=256)
+def _compile(content: str) -> tuple[JinjaTemplate, tuple[str, ...]]:
+    """Compile template content, returning the Jinja2 template and its comments."""
+    # Temporarily replace comments to avoid Jinja2 parsing issues
+    comments: list[str] = []
+
+    def save_comment(match: re.Match) -> str:
+        comments.append(match.group(0))
+        return f"__COMMENT_{len(comments) - 1}__"
+
+    escaped = COMMENT_PATTERN.sub(save_comment, content)
+    return _ENV.from_string(escaped), tuple(comments)
+
+
 def render(
     template: Template, values: dict[str, str], remove_comments: bool = True
 ) -> str:
@@ -119,26 +144,8 @@ def render(
     Returns:
         Rendered markdown string
     """
-    content = template.content
-
-    # Temporarily replace comments to avoid Jinja2 parsing issues
-    comments: list[str] = []
-
-    def save_comment(match: re.Match) -> str:
-        comments.append(match.group(0))
-        return f"__COMMENT_{len(comments) - 1}__"
-
-    escaped = COMMENT_PATTERN.sub(save_comment, content)
-
-    # Render with custom delimiters for <variable> syntax
-    env = Environment(
-        undefined=StrictUndefined,
-        autoescape=False,
-        keep_trailing_newline=True,
-        variable_start_string="<",
-        variable_end_string=">",
-    )
-    rendered = env.from_string(escaped).render(**values)
+    compiled, comments = _compile(template.content)
+    rendered = compiled.render(**values)
 
     # Handle comments
     if remove_comments:
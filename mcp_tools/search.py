@@ -0,0 +1,537 @@
+"""In-memory inverted index for searching registered templates."""
+
+import heapq
+import math
+import re
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+from typing import Iterable
+
+from .models import Template, TemplateSearchHit, TemplateSearchResults
+from .parser import SECTION_PATTERN
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Relative weight of a token depending on where it appears in the template
+FIELD_WEIGHTS = {
+    "name": 4.0,
+    "about": 2.0,
+    "section": 1.5,
+    "variable": 1.0,
+}
+
+# Score multiplier for tokens matched by prefix rather than exactly
+PREFIX_PENALTY = 0.5
+
+# Upper bound on vocabulary tokens a single query term may expand to. When a
+# prefix matches more tokens, the most frequent ones are kept.
+MAX_PREFIX_EXPANSIONS = 64
+
+# Number of matched query terms kept until the index next changes
+TERM_CACHE_SIZE = 1024
+
+# A posting switches to a bitset once it covers 1 in DENSE_RATIO slots, and
+# back to a slot list below half that, so a bitset never takes more memory
+# than the list it replaces
+DENSE_RATIO = 64
+
+# Updates buffered before they are folded into a posting's bitset
+PENDING_LIMIT = 64
+
+# Slots are compacted once this many are free and they outnumber used ones
+COMPACT_MIN_FREE = 1024
+
+# Documents matched by a query term: a bitset over slots, or a set of slots
+# when the term only matches a few templates
+Docs = int | set[int]
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _template_fields(tool_name: str, template: Template) -> dict[str, str]:
+    """Collect the searchable text of a template, grouped by field."""
+    sections = (
+        re.sub(r"^###\s*|\s*:$", "", header.strip())
+        for header in SECTION_PATTERN.findall(template.content)
+    )
+    variables = (f"{var.name} {var.description}" for var in template.variables)
+
+    return {
+        "name": f"{template.name} {tool_name}",
+        "about": template.about,
+        "section": " ".join(sections),
+        "variable": " ".join(variables),
+    }
+
+
+def _set_bits(buffer: bytearray, slots: Iterable[int]) -> None:
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+
+
+def _to_bits(slots: Iterable[int], width: int) -> int:
+    buffer = bytearray((width >> 3) + 1)
+    _set_bits(buffer, slots)
+    return int.from_bytes(buffer, "little")
+
+
+def _to_bytes(bits: int) -> bytes:
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+
+def _slots_of(bits: int) -> list[int]:
+    """Positions of the set bits, in ascending order."""
+    slots = []
+    for index, byte in enumerate(_to_bytes(bits)):
+        if byte:
+            slots.extend(index * 8 + bit for bit in range(8) if byte >> bit & 1)
+    return slots
+
+
+def _iter_bits(bits: int, skip: int, take: int):
+    """Yield the positions of set bits in ascending order, after `skip` of them."""
+    position = 0
+    if skip:
+        # Find the lowest position with `skip` set bits below it
+        lo, hi = 0, bits.bit_length()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (bits & ((1 << mid) - 1)).bit_count() < skip:
+                lo = mid + 1
+            else:
+                hi = mid
+        position = lo
+        bits >>= lo
+
+    while bits and take:
+        low = (bits & -bits).bit_length() - 1
+        position += low
+        yield position
+        bits >>= low + 1
+        position += 1
+        take -= 1
+
+
+def _filter_bits(slots: Iterable[int], bits: int) -> set[int]:
+    """Keep the slots whose bit is set."""
+    view = _to_bytes(bits)
+    size = len(view)
+    return {
+        slot for slot in slots if slot >> 3 < size and view[slot >> 3] >> (slot & 7) & 1
+    }
+
+
+def _layers(scored: list[tuple[float, int]]) -> tuple[list[tuple[float, int]], int]:
+    """
+    Turn (score, bitset) pairs into disjoint layers ordered by score.
+
+    Each document keeps only its highest score. Returns the layers and the
+    union of all documents.
+    """
+    layers: list[tuple[float, int]] = []
+    covered = 0
+
+    for score, bits in sorted(scored, key=lambda layer: -layer[0]):
+        bits &= ~covered
+        if bits:
+            layers.append((score, bits))
+            covered |= bits
+
+    return layers, covered
+
+
+class _Posting:
+    """
+    Slots of the templates containing a token with a given weight.
+
+    Sparse postings keep a sorted slot list. Dense postings keep a bitset
+    instead, updated in batches so adding or removing a template does not
+    copy it every time.
+    """
+
+    __slots__ = ("count", "slots", "_bits", "_added", "_removed")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.slots: list[int] | None = []  # None while dense
+        self._bits = 0
+        self._added: list[int] = []
+        self._removed: list[int] = []
+
+    def add(self, slot: int) -> None:
+        """Add a slot higher than any already in the posting."""
+        self.count += 1
+
+        if self.slots is not None:
+            self.slots.append(slot)
+            if self.count * DENSE_RATIO > slot:
+                self._bits = _to_bits(self.slots, slot)
+                self.slots = None
+            return
+
+        self._added.append(slot)
+        if self.count * DENSE_RATIO * 2 <= slot:
+            self._sparsify()
+        elif len(self._added) >= PENDING_LIMIT:
+            self._fold()
+
+    def remove(self, slot: int) -> None:
+        self.count -= 1
+
+        if self.slots is not None:
+            del self.slots[bisect_left(self.slots, slot)]
+            return
+
+        self._removed.append(slot)
+        if len(self._removed) >= PENDING_LIMIT:
+            self._fold()
+            if self.count * DENSE_RATIO * 2 <= self._bits.bit_length():
+                self._sparsify()
+
+    def bits(self) -> int:
+        """Return the bitset of a dense posting."""
+        if self._added or self._removed:
+            self._fold()
+        return self._bits
+
+    def _fold(self) -> None:
+        top = max(self._bits.bit_length(), self._added[-1] + 1 if self._added else 0)
+        buffer = bytearray(self._bits.to_bytes((top >> 3) + 1, "little"))
+        _set_bits(buffer, self._added)
+        for slot in self._removed:
+            buffer[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+        self._bits = int.from_bytes(buffer, "little")
+        self._added.clear()
+        self._removed.clear()
+
+    def _sparsify(self) -> None:
+        self.slots = _slots_of(self.bits())
+        self._bits = 0
+
+
+def _union(postings: list[_Posting], width: int) -> int:
+    """Collect the slots of several postings into a bitset of `width` slots."""
+    bits = 0
+    sparse = []
+    for posting in postings:
+        if posting.slots is None:
+            bits |= posting.bits()
+        else:
+            sparse.append(posting.slots)
+    if sparse:
+        bits |= _to_bits(chain.from_iterable(sparse), width)
+    return bits
+
+
+class TemplateIndex:
+    """
+    Inverted index over registered templates.
+
+    Templates are keyed by tool name and indexed on their name, about,
+    section headers and variable descriptions. The index is updated
+    incrementally as templates are added or removed.
+
+    Each template occupies a slot, assigned in increasing order and
+    compacted once enough are freed. Postings are stored per token and
+    weight, as sorted slot lists for rare tokens and as integer bitsets for
+    tokens shared by many templates, so memory stays proportional to the
+    number of postings while common tokens stay cheap to intersect.
+    """
+
+    def __init__(self) -> None:
+        self._templates: dict[str, Template] = {}
+        self._doc_tokens: dict[str, dict[str, float]] = {}
+        self._slots: dict[str, int] = {}
+        self._names: list[str] = []  # Tool name per slot, empty if free
+        self._postings: dict[str, dict[float, _Posting]] = {}
+        self._frequency: dict[str, int] = {}
+        self._vocabulary: list[str] = []
+        self._term_cache: dict[str, tuple[list[tuple[float, Docs]], Docs, bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __contains__(self, tool_name: object) -> bool:
+        return tool_name in self._templates
+
+    def add(self, tool_name: str, template: Template) -> None:
+        """Index a template under its tool name, replacing any previous entry."""
+        if tool_name in self._templates:
+            self.remove(tool_name)
+        self._term_cache.clear()
+
+        tokens: dict[str, float] = {}
+        for field, text in _template_fields(tool_name, template).items():
+            for token in set(tokenize(text)):
+                tokens[token] = tokens.get(token, 0.0) + FIELD_WEIGHTS[field]
+
+        for token in tokens:
+            frequency = self._frequency.get(token, 0)
+            if not frequency:
+                insort(self._vocabulary, token)
+            self._frequency[token] = frequency + 1
+
+        self._templates[tool_name] = template
+        self._doc_tokens[tool_name] = tokens
+        self._insert(tool_name, tokens)
+
+    def _insert(self, tool_name: str, tokens: dict[str, float]) -> None:
+        """Give a template the next slot and add it to the postings."""
+        slot = len(self._names)
+        self._names.append(tool_name)
+        self._slots[tool_name] = slot
+
+        for token, weight in tokens.items():
+            postings = self._postings.setdefault(token, {})
+            posting = postings.get(weight)
+            if posting is None:
+                posting = postings[weight] = _Posting()
+            posting.add(slot)
+
+    def remove(self, tool_name: str) -> None:
+        """Remove a template from the index. Unknown names are ignored."""
+        if self._templates.pop(tool_name, None) is None:
+            return
+        self._term_cache.clear()
+
+        slot = self._slots.pop(tool_name)
+        for token, weight in self._doc_tokens.pop(tool_name).items():
+            postings = self._postings[token]
+            posting = postings[weight]
+            posting.remove(slot)
+            if not posting.count:
+                del postings[weight]
+
+            self._frequency[token] -= 1
+            if not self._frequency[token]:
+                del self._frequency[token]
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+        self._names[slot] = ""
+
+        free = len(self._names) - len(self._templates)
+        if free >= COMPACT_MIN_FREE and free > len(self._templates):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Reassign slots to the remaining templates, keeping their order."""
+        names = [name for name in self._names if name]
+        self._names = []
+        self._postings = {}
+        for name in names:
+            self._insert(name, self._doc_tokens[name])
+
+    def _expand(self, term: str) -> tuple[list[str], bool]:
+        """
+        Find the vocabulary tokens a term matches by prefix.
+
+        Returns the most frequent expansions and whether any were dropped.
+        """
+        start = bisect_right(self._vocabulary, term)
+        stop = bisect_left(self._vocabulary, term + "\x7f", lo=start)
+        expansions = self._vocabulary[start:stop]
+
+        if len(expansions) <= MAX_PREFIX_EXPANSIONS:
+            return expansions, False
+
+        expansions.sort(key=self._frequency.__getitem__, reverse=True)
+        return expansions[:MAX_PREFIX_EXPANSIONS], True
+
+    def _match_term(self, term: str) -> tuple[list[tuple[float, Docs]], Docs, bool]:
+        """
+        Score documents for one query term using exact and prefix matches.
+
+        Returns (score, documents) layers ordered by score, all matching
+        documents, and whether prefix expansion was capped. Terms matching
+        tokens shared by many templates use disjoint bitset layers; other
+        terms use sets of slots, where a document's score is that of the
+        first layer containing it.
+        """
+        cached = self._term_cache.get(term)
+        if cached is not None:
+            return cached
+
+        total = len(self._templates)
+        exact = self._postings.get(term, {})
+        exact_idf = math.log(1 + total / self._frequency[term]) if exact else 0.0
+
+        # Prefix matches are scored as one group, by their best weight
+        expansions, truncated = self._expand(term)
+        by_weight: dict[float, list[_Posting]] = {}
+        for token in expansions:
+            for weight, posting in self._postings[token].items():
+                by_weight.setdefault(weight, []).append(posting)
+
+        postings = chain(exact.values(), chain.from_iterable(by_weight.values()))
+        if all(posting.slots is not None for posting in postings):
+            layers, covered = self._rare_layers(exact, exact_idf, by_weight)
+        else:
+            width = len(self._names)
+            scored = [
+                (weight * exact_idf, _union([posting], width))
+                for weight, posting in exact.items()
+            ]
+            if by_weight:
+                grouped = {
+                    weight: _union(postings, width)
+                    for weight, postings in by_weight.items()
+                }
+                matched = 0
+                for bits in grouped.values():
+                    matched |= bits
+                idf = math.log(1 + total / matched.bit_count()) * PREFIX_PENALTY
+                scored.extend((weight * idf, bits) for weight, bits in grouped.items())
+            layers, covered = _layers(scored)
+
+        if len(self._term_cache) >= TERM_CACHE_SIZE:
+            self._term_cache.clear()
+        self._term_cache[term] = (layers, covered, truncated)
+        return layers, covered, truncated
+
+    def _rare_layers(
+        self,
+        exact: dict[float, _Posting],
+        exact_idf: float,
+        by_weight: dict[float, list[_Posting]],
+    ) -> tuple[list[tuple[float, set[int]]], set[int]]:
+        """Score a term matching only sparse postings, with one set per weight."""
+        scored = [
+            (weight * exact_idf, set(posting.slots))
+            for weight, posting in exact.items()
+        ]
+        covered = set().union(*(slots for _, slots in scored))
+
+        if by_weight:
+            grouped = {
+                weight: set().union(*(posting.slots for posting in postings))
+                for weight, postings in by_weight.items()
+            }
+            matched = set().union(*grouped.values())
+            idf = math.log(1 + len(self._templates) / len(matched)) * PREFIX_PENALTY
+            scored.extend((weight * idf, slots) for weight, slots in grouped.items())
+            covered |= matched
+
+        scored.sort(key=lambda layer: -layer[0])
+        return scored, covered
+
+    def _hit(self, slot: int, score: float) -> TemplateSearchHit:
+        tool_name = self._names[slot]
+        template = self._templates[tool_name]
+        return TemplateSearchHit(
+            tool_name=tool_name,
+            name=template.name,
+            about=template.about,
+            score=round(score, 4),
+        )
+
+    def search(
+        self, query: str, limit: int = 10, offset: int = 0
+    ) -> TemplateSearchResults:
+        """
+        Search indexed templates.
+
+        Every query term must match, either exactly or as a prefix of an
+        indexed token. Results are ranked by score, then by registration
+        order; re-adding a template moves it behind the others.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results to return
+            offset: Number of ranked results to skip
+
+        Returns:
+            A page of ranked results and the total number of matches.
+            `truncated` is set when a prefix matched too many tokens to
+            expand them all, making `total` a lower bound.
+        """
+        results = TemplateSearchResults(query=query, offset=offset, limit=limit)
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return results
+
+        matches = [self._match_term(term) for term in terms]
+        results.truncated = any(truncated for _, _, truncated in matches)
+
+        if all(isinstance(covered, int) for _, covered, _ in matches):
+            self._rank_dense(matches, results)
+        else:
+            self._rank_sparse(matches, results)
+        return results
+
+    def _rank_dense(self, matches: list, results: TemplateSearchResults) -> None:
+        """Rank matches of common terms by walking bitset layers in order."""
+        candidates = matches[0][1]
+        for _, covered, _ in matches[1:]:
+            candidates &= covered
+        if not candidates:
+            return
+
+        # Combine per-term layers, merging documents with equal total scores
+        layers: list[tuple[float, int]] = [(0.0, candidates)]
+        for term_layers, _, _ in matches:
+            combined: dict[float, int] = {}
+            for score, bits in layers:
+                for term_score, term_bits in term_layers:
+                    both = bits & term_bits
+                    if both:
+                        key = round(score + term_score, 6)
+                        combined[key] = combined.get(key, 0) | both
+            layers = sorted(combined.items(), reverse=True)
+
+        results.total = candidates.bit_count()
+
+        skip, take = results.offset, results.limit
+        for score, bits in layers:
+            count = bits.bit_count()
+            if skip >= count:
+                skip -= count
+                continue
+
+            for slot in _iter_bits(bits, skip, take):
+                results.items.append(self._hit(slot, score))
+            take -= min(count - skip, take)
+            skip = 0
+            if not take:
+                break
+
+    def _rank_sparse(self, matches: list, results: TemplateSearchResults) -> None:
+        """Rank matches when at least one term is rare, scoring each candidate."""
+        rare = sorted(
+            (match for match in matches if isinstance(match[1], set)),
+            key=lambda match: len(match[1]),
+        )
+        candidates = rare[0][1].intersection(*(covered for _, covered, _ in rare[1:]))
+        common = [match for match in matches if isinstance(match[1], int)]
+        for _, covered, _ in common:
+            if candidates:
+                candidates = _filter_bits(candidates, covered)
+        if not candidates:
+            return
+
+        # Each document takes the score of the first layer containing it
+        scores = dict.fromkeys(candidates, 0.0)
+        for layers, _, _ in matches:
+            remaining = candidates
+            for score, docs in layers:
+                if isinstance(docs, int):
+                    hits = _filter_bits(remaining, docs)
+                else:
+                    hits = remaining & docs
+                for slot in hits:
+                    scores[slot] += score
+                remaining = remaining - hits
+                if not remaining:
+                    break
+
+        results.total = len(scores)
+        ranked = heapq.nsmallest(
+            results.offset + results.limit,
+            scores.items(),
+            key=lambda item: (-round(item[1], 6), item[0]),
+        )
+        for slot, score in ranked[results.offset :]:
+            results.items.append(self._hit(slot, score))
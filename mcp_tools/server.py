@@ -14,7 +14,9 @@ from starlette.middleware.cors import CORSMiddleware
 
 from .loader import load, is_url
 from .parser import parse
-from .generator import register_template
+from .generator import register_template, register_search, register_manifest
+from .manifest import ToolManifest
+from .search import TemplateIndex
 
 # Configuration from environment
 TITLE = os.getenv("MCP_TITLE", "Python MCP Template")
@@ -26,6 +28,12 @@ TEMPLATES_SOURCE = os.getenv("MCP_TEMPLATES_SOURCE", ".github/ISSUE_TEMPLATE")
 # FastAPI app
 app = FastAPI(title=TITLE, description=DESCRIPTION)
 
+# Search index over registered templates
+index = TemplateIndex()
+
+# Cached tool manifest, rebuilt once per registry generation
+tool_manifest = ToolManifest(app)
+
 
 def register_from_source(source: str) -> int:
     """
@@ -38,7 +46,7 @@ def register_from_source(source: str) -> int:
     for template in load(source):
         try:
             parsed = parse(template)
-            register_template(app, parsed)
+            register_template(app, parsed, index=index, manifest=tool_manifest)
             print(f"  ✓ Registered: {parsed.name} from {template.source}")
             count += 1
         except Exception as e:
@@ -66,6 +74,12 @@ for source in (s.strip() for s in TEMPLATES_SOURCE.split(",") if s.strip()):
     except Exception as e:
         print(f"  ✗ Error loading {source}: {e}")
 
+register_search(app, index)
+register_manifest(app, tool_manifest)
+
+# Precompute the manifest for the initial registry
+tool_manifest.snapshot()
+
 # Create MCP server
 mcp = FastMCP.from_fastapi(app=app, stateless_http=True, json_response=True)
 
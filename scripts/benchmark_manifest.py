@@ -0,0 +1,60 @@
+"""Measure tool manifest build time and payload size as the catalog grows."""
+
+import sys
+import time
+
+from fastapi import FastAPI
+
+from mcp_tools.generator import register_template
+from mcp_tools.manifest import ToolManifest
+from mcp_tools.parser import parse
+from mcp_tools.models import Template
+
+TEMPLATE = """---
+name: Template {i}
+about: Synthetic template number {i}
+---
+
+### Summary:
+<!-- A concise description of the request. -->
+<summary>
+
+### Details:
+<!--
+Example:
+- Step one
+- Step two
+-->
+<details>
+"""
+
+
+def build_manifest(count: int) -> ToolManifest:
+    """Register `count` synthetic templates and return their manifest."""
+    app = FastAPI()
+    manifest = ToolManifest(app)
+
+    for i in range(count):
+        template = parse(Template(name=f"template_{i}", content=TEMPLATE.format(i=i)))
+        register_template(app, template)
+
+    manifest.invalidate()
+    return manifest
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 100, 1000]
+
+    print(f"{'templates':>10} {'build (s)':>10} {'size (KiB)':>11} {'serve (ms)':>11}")
+    for count in sizes:
+        snapshot = build_manifest(count).snapshot()
+
+        # Serving a cached manifest only joins the pre-serialized tools
+        start = time.perf_counter()
+        snapshot.page()
+        serve_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"{count:>10} {snapshot.build_seconds:>10.3f} "
+            f"{snapshot.size_bytes / 1024:>11.1f} {serve_ms:>11.3f}"
+        )